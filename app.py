@@ -2,11 +2,13 @@ from tkinter import ttk
 from tkinter import *
 import customtkinter as ct  # For a more modern style
 from datetime import datetime
-from models import Product
+from models import Product, product_rows, product_category_index
 from db import session, Base, engine
+from watcher import ChangeWatcher
 import json
 
 Base.metadata.create_all(engine)
+product_category_index.create(engine, checkfirst=True)  # Tables created before the index existed
 
 
 # Load categories from categories.json
@@ -38,6 +40,8 @@ category_list = load_categories()
 13. Exceptions in all methods.
 14. Implement SQLAlchemy.
 15. Disabled add button while editing a product.
+16. Refresh the table when other processes change the database.
+17. List products without the ORM (only the displayed columns).
 
 > Pending Improvements
 * Add search bar.
@@ -47,6 +51,9 @@ category_list = load_categories()
 
 class MainWindow:
     db = "database/products.db"
+    refresh_interval = 1000  # Time in milliseconds between checks for external changes
+    orm_listing = False  # True to list products through Product objects instead of plain rows
+    listing_chunk_size = 1000  # Rows read from the database at a time when listing
 
     def __init__(self, root, percentage=0.3):
         self.window = root
@@ -55,6 +62,9 @@ class MainWindow:
         self.window.wm_iconbitmap("resources/icon.ico")
         self.window.geometry("450x600")  # Initial size
 
+        # Detect manual window close
+        self.window.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Configuration to center everything in the window
         self.window.grid_columnconfigure(0, weight=1)
         self.window.grid_rowconfigure(0, weight=0)  # Top frame
@@ -78,8 +88,19 @@ class MainWindow:
         self.setup_buttons()
 
         # Retrieve products
+        self.watcher = ChangeWatcher()
+        self.listing_generation = 0  # Identifies the latest listing, to ignore older unfinished ones
+        self.listing_done = True
         self.get_products()
 
+        # Check periodically for changes made by other processes
+        self.window.after(self.refresh_interval, self.refresh_products)
+
+    def on_close(self):
+        """Handle manual closing of the main window."""
+        self.watcher.close()
+        self.window.destroy()
+
     ''' Interface Functions '''
 
     def create_top_frame(self, parent, frame_title, button_text, button_command, row=0, category="", name="", price=""):
@@ -356,20 +377,132 @@ class MainWindow:
 
     def get_products(self):
 
+        # Changes recorded up to now are included in this reload
+        self.watcher.sync()
+        self.listing_generation += 1
+
         # Clear the interface table before displaying the products
         self.table.delete(*self.table.get_children())
+        self.category_rows = {}  # First row id of each category in the table
+
+        if self.orm_listing:
+            # Query all products in the database, ordered by category
+            products = session.query(Product).populate_existing().order_by(Product.category.desc()).all()
+
+            # Insert each product into the table
+            for product in products:
+                self.table.insert(
+                    "",
+                    0,
+                    iid=product.id,  # Row identifier used by refresh_products
+                    text=product.id,  # ID Column
+                    values=(product.name, product.price, product.category)  # Columns Name, Price, Category
+                )
+                self.category_rows[product.category] = str(product.id)
+            return
+
+        self.listing_done = False
+        self.insert_chunks(None, self.listing_generation)
+
+    def insert_chunks(self, after, generation):
+        """
+        Reads the next chunk of rows, inserts it into the table and schedules the following one,
+        so the window stays responsive while a long list is displayed.
+
+        Args:
+            after (tuple): (category, id) of the last row inserted. None for the first chunk.
+            generation (int): Listing this chunk belongs to.
+        """
+        if generation != self.listing_generation:
+            return  # A newer listing replaced this one
+
+        # Short query per chunk: other processes are not blocked from writing between chunks
+        with engine.connect() as connection:
+            chunk = product_rows(connection, after, self.listing_chunk_size)
+
+        for prod_id, name, price, category in chunk:
+            # A product moved to another category between chunks may be read twice
+            if self.table.exists(prod_id):
+                continue
+            self.table.insert("", 0, iid=prod_id, text=prod_id, values=(name, price, category))
+            self.category_rows[category] = str(prod_id)
+
+        if len(chunk) < self.listing_chunk_size:
+            self.listing_done = True
+            return
+
+        last = chunk[-1]
+        self.window.after(0, self.insert_chunks, (last.category, last.id), generation)
 
-        # Query all products in the database, ordered by category
-        products = session.query(Product).order_by(Product.category.desc()).all()
+    def refresh_products(self):
+        """
+        Applies the changes made by other processes to the table, row by row.
+        """
+        # Wait until the table is completely listed
+        if not self.listing_done:
+            self.window.after(self.refresh_interval, self.refresh_products)
+            return
+
+        try:
+            changes = self.watcher.poll()
+            if changes:
+                session.expire_all()  # Loaded Product objects may hold outdated values
+            elif changes is None:
+                # Some changes were missed, so the whole table is reloaded
+                session.expire_all()
+                self.get_products()
+                changes = []
+
+            for prod_id, name, price, category in changes:
+                row_id = str(prod_id)
+
+                if self.table.exists(row_id):
+                    # Updated product in the same category: only the values change
+                    if name is not None and self.table.item(row_id, 'values')[2] == category:
+                        self.table.item(row_id, values=(name, price, category))
+                        continue
+                    self.delete_row(row_id)
+
+                # Deleted product
+                if name is None:
+                    continue
+
+                self.insert_row(row_id, name, price, category)
+
+            # Remove expired changes from the log (skipped if another process is writing)
+            self.watcher.prune()
+        except Exception as e:
+            print(f"Error refreshing products: {e}")
+
+        self.window.after(self.refresh_interval, self.refresh_products)
+
+    def insert_row(self, row_id, name, price, category):
+        """
+        Inserts a row at the beginning of its category group, keeping the table sorted by category.
+        """
+        if category in self.category_rows:
+            index = self.table.index(self.category_rows[category])
+        else:
+            # Place the new group before the first bigger category
+            bigger = [other for other in self.category_rows if other > category]
+            index = self.table.index(self.category_rows[min(bigger)]) if bigger else "end"
+
+        self.table.insert("", index, iid=row_id, text=row_id, values=(name, price, category))
+        self.category_rows[category] = row_id
+
+    def delete_row(self, row_id):
+        """
+        Deletes a row, moving the start of its category group to the next row if needed.
+        """
+        category = self.table.item(row_id, 'values')[2]
+        if self.category_rows.get(category) == row_id:
+            next_id = self.table.next(row_id)
+            if next_id and self.table.item(next_id, 'values')[2] == category:
+                self.category_rows[category] = next_id
+            else:
+                del self.category_rows[category]
 
-        # Insert each product into the table
-        for product in products:
-            self.table.insert(
-                "",
-                0,
-                text=product.id,  # ID Column
-                values=(product.name, product.price, product.category)  # Columns Name, Price, Category
-            )
+        self.table.delete(row_id)
 
     ''' Interactions '''
 
@@ -504,7 +637,7 @@ class MainWindow:
 
             # Get selected product
             prod_id = self.table.item(self.table.selection())['text']
-            product = session.query(Product).filter_by(id=prod_id).first()
+            product = session.query(Product).populate_existing().filter_by(id=prod_id).first()
             if product:
                 EditWindow(self, product)  # Pass the product object to the editing window
 
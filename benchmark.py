@@ -0,0 +1,102 @@
+'''
+Compares the ORM listing with the plain rows listing used by MainWindow.get_products.
+
+Only the database read is timed: inserting the rows into the Treeview is not included.
+Both listings run `runs` times in alternating order, and the best run of each is reported.
+
+Usage:
+    python benchmark.py [rows ...]     (default: 100000 1000000)
+'''
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from models import Product, product_rows
+from db import Base
+
+runs = 3
+
+categories = ["Computers", "Phones", "Audio & Video", "Accessories", "Others"]
+
+
+def create_database(path, rows, batch_size=50000):
+    """
+    Creates a temporary database filled with `rows` products.
+    """
+    engine = create_engine(f'sqlite:///{path}')
+    Base.metadata.create_all(engine)
+
+    now = datetime.now()
+    with engine.begin() as connection:
+        for start in range(0, rows, batch_size):
+            connection.execute(insert(Product), [
+                {
+                    "name": f"Product {i}",
+                    "price": i % 1000 + 0.99,
+                    "category": categories[i % len(categories)],
+                    "created_date": now
+                }
+                for i in range(start, min(start + batch_size, rows))
+            ])
+    return engine
+
+
+def orm_listing(engine):
+    session = sessionmaker(bind=engine)()
+    try:
+        products = session.query(Product).order_by(Product.category.desc()).all()
+        return [(product.id, product.name, product.price, product.category) for product in products]
+    finally:
+        session.close()
+
+
+def rows_listing(engine, chunk_size=1000):
+    # One short query per chunk, as MainWindow.insert_chunks does
+    rows, after = [], None
+    while True:
+        with engine.connect() as connection:
+            chunk = product_rows(connection, after, chunk_size)
+        rows += [(prod_id, name, price, category) for prod_id, name, price, category in chunk]
+        if len(chunk) < chunk_size:
+            return rows
+        after = (chunk[-1].category, chunk[-1].id)
+
+
+def measure(function, engine):
+    start = time.perf_counter()
+    result = function(engine)
+    return time.perf_counter() - start, len(result)
+
+
+def best_times(engine):
+    """
+    Runs both listings in alternating order, so warm-up costs are not charged to only one of them.
+    """
+    orm_times, rows_times = [], []
+    for run in range(runs):
+        order = [(orm_listing, orm_times), (rows_listing, rows_times)]
+        if run % 2:
+            order.reverse()
+        for function, times in order:
+            times.append(measure(function, engine))
+    return min(orm_times), min(rows_times)
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [100000, 1000000]
+
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as folder:
+            engine = create_database(os.path.join(folder, "benchmark.db"), rows)
+
+            (orm_time, orm_count), (rows_time, rows_count) = best_times(engine)
+            engine.dispose()
+
+        print(f" {rows} products")
+        print(f"   Best of {runs} runs (database read only)")
+        print(f"   ORM listing:  {orm_time:.3f} s ({orm_count} rows)")
+        print(f"   Rows listing: {rows_time:.3f} s ({rows_count} rows)")
+        print(f"   Speedup:      {orm_time / rows_time:.1f}x")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index, select, func, tuple_
 import db  # Import the database configuration from db.py
 
 
@@ -23,3 +23,55 @@ class Product(db.Base):
     # Represent the object as a string when printed.
     def __str__(self):
         return f"  • Producto {self.id}: {self.name} Precio: ${self.price}"
+
+
+class ProductChange(db.Base):
+    # Table Configuration
+    __tablename__ = "product_change"
+    __table_args__ = {"sqlite_autoincrement": True}  # Never reuse a sequence number
+
+    # Columns
+    seq = Column(Integer, primary_key=True)
+    product_id = Column(Integer, nullable=False, index=True)
+    changed_date = Column(DateTime, nullable=False, server_default=func.current_timestamp())
+
+
+# Lets each chunk of product_rows start where the previous one ended
+product_category_index = Index("product_category_idx", Product.category, Product.id)
+
+
+def product_rows(connection, after=None, chunk_size=1000):
+    """
+    Reads a chunk of the columns displayed in the table without building Product objects.
+
+    Args:
+        connection: SQLAlchemy connection used to run the query.
+        after (tuple): (category, id) of the last row of the previous chunk. None for the first chunk.
+        chunk_size (int): Maximum number of rows to read.
+
+    Returns:
+        list: (id, name, price, category) rows, ordered by category and id (descending).
+    """
+    query = (
+        select(Product.id, Product.name, Product.price, Product.category)
+        .order_by(Product.category.desc(), Product.id.desc())
+    )
+    if after is None:
+        return connection.execute(query.limit(chunk_size)).all()
+
+    category, prod_id = after
+    if category is None:
+        # Products without category are listed last
+        return connection.execute(
+            query.where(Product.category.is_(None), Product.id < prod_id).limit(chunk_size)
+        ).all()
+
+    rows = connection.execute(
+        query.where(tuple_(Product.category, Product.id) < (category, prod_id)).limit(chunk_size)
+    ).all()
+    if len(rows) < chunk_size:
+        # The comparison skips products without category, which come after all the others
+        rows += connection.execute(
+            query.where(Product.category.is_(None)).limit(chunk_size - len(rows))
+        ).all()
+    return rows
@@ -0,0 +1,152 @@
+from sqlalchemy import select, delete, func, text
+from sqlalchemy.exc import OperationalError
+import time
+from models import Product, ProductChange
+from db import engine
+
+# Triggers that record every change made to the product table, by any process
+change_triggers = [
+    '''
+    CREATE TRIGGER IF NOT EXISTS product_change_insert AFTER INSERT ON product
+    BEGIN
+        INSERT INTO product_change (product_id) VALUES (NEW.id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS product_change_update AFTER UPDATE ON product
+    BEGIN
+        INSERT INTO product_change (product_id) VALUES (NEW.id);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS product_change_delete AFTER DELETE ON product
+    BEGIN
+        INSERT INTO product_change (product_id) VALUES (OLD.id);
+    END
+    ''',
+]
+
+
+class ChangeWatcher:
+    """
+    Detects changes made to the product table by other connections or processes.
+
+    Polling is cheap: `PRAGMA data_version` only changes when another connection
+    commits, so the product_change log is queried only when there is something new.
+    Polls and syncs only read. Several watchers (one per running app) share the log,
+    so changes are kept for `retention` seconds instead of being removed once seen.
+    """
+    retention = 3600  # Seconds a change stays in the log, so every running watcher can read it
+    prune_interval = 60  # Seconds between checks for changes older than the retention
+    prune_timeout = 100  # Milliseconds to wait for other writers before giving up a prune
+
+    def __init__(self):
+        self.last_seq = 0
+        self.data_version = None
+        self.last_prune = time.monotonic()
+
+        # Create the triggers
+        with engine.begin() as connection:
+            for trigger in change_triggers:
+                connection.execute(text(trigger))
+
+        # data_version is per connection, so the same one must be used on every poll
+        self.connection = engine.connect()
+
+    def last_issued_seq(self):
+        """
+        Returns the highest sequence number ever given to a change, even if it was already removed.
+        """
+        seq = self.connection.execute(
+            text("SELECT seq FROM sqlite_sequence WHERE name = 'product_change'")
+        ).scalar()
+        return seq or 0
+
+    def prune(self):
+        """
+        Removes the changes older than the retention, at most once every `prune_interval` seconds.
+
+        It never waits long for another process holding the write lock: if the database is busy,
+        the changes are kept and removed by a later prune.
+        """
+        if time.monotonic() - self.last_prune < self.prune_interval:
+            return
+        self.last_prune = time.monotonic()
+
+        # Only write when some change has expired
+        expired = ProductChange.changed_date < func.datetime("now", f"-{self.retention} seconds")
+        oldest = self.connection.execute(
+            select(ProductChange.seq).where(expired).order_by(ProductChange.seq).limit(1)
+        ).scalar()
+        if oldest is None:
+            self.connection.rollback()
+            return
+
+        busy_timeout = self.connection.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        self.connection.exec_driver_sql(f"PRAGMA busy_timeout = {self.prune_timeout}")
+        try:
+            self.connection.execute(delete(ProductChange).where(expired))
+            self.connection.commit()
+        except OperationalError as e:
+            self.connection.rollback()
+            print(f"Change log not pruned: {e.orig}")
+        finally:
+            self.connection.exec_driver_sql(f"PRAGMA busy_timeout = {busy_timeout}")
+
+    def sync(self):
+        """
+        Marks every recorded change as seen. Call it before a full reload of the table.
+        """
+        last_seq = self.last_issued_seq()
+        data_version = self.connection.exec_driver_sql("PRAGMA data_version").scalar()
+        self.connection.rollback()
+
+        self.last_seq = last_seq
+        self.data_version = data_version
+
+    def poll(self):
+        """
+        Returns the products changed since the last poll or sync.
+
+        Returns:
+            list: (id, name, price, category) rows. Deleted products have name, price and category set to None.
+            None if some changes expired before being seen (no poll for longer than the retention):
+            the table must be reloaded.
+        """
+        data_version = self.connection.exec_driver_sql("PRAGMA data_version").scalar()
+        if data_version == self.data_version:
+            self.connection.rollback()
+            return []  # Nothing was committed since the last poll
+
+        last_seq = self.last_issued_seq()
+        if last_seq == self.last_seq:
+            self.connection.rollback()
+            self.data_version = data_version
+            return []  # The commit did not change any product
+
+        # Latest change of each product, joined with its current values (if it still exists)
+        new_changes = (ProductChange.seq > self.last_seq) & (ProductChange.seq <= last_seq)
+        last_change = func.max(ProductChange.seq)
+        rows = self.connection.execute(
+            select(last_change, ProductChange.product_id, Product.name, Product.price, Product.category)
+            .outerjoin(Product, Product.id == ProductChange.product_id)
+            .where(new_changes)
+            .group_by(ProductChange.product_id)
+            .order_by(last_change)
+        ).all()
+        found = self.connection.execute(select(func.count()).where(new_changes)).scalar()
+        self.connection.rollback()
+
+        # Sequence numbers are never skipped, so missing ones expired before this poll
+        complete = found == last_seq - self.last_seq
+
+        # The changes are marked as seen only once they have all been read
+        self.last_seq = last_seq
+        self.data_version = data_version
+
+        if not complete:
+            return None
+        return [row[1:] for row in rows]
+
+    def close(self):
+        self.connection.close()